@@ -3,16 +3,45 @@
 HTTP Server with automatic browser opening
 """
 
-import http.server
-import socketserver
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 import webbrowser
 import threading
+import shutil
 import time
 import os
 
 # Configuration
 HTML_OUTPUT_FILE = 'mapdata.html'
 
+
+class MapRequestHandler(SimpleHTTPRequestHandler):
+    """Request handler that serves precompressed data files and lets
+    browsers cache them"""
+
+    def end_headers(self):
+        # The data files only change when the script is re-run, so repeat
+        # page loads can serve them from the browser cache
+        if self.path.endswith(('.json', '.bin')):
+            self.send_header('Cache-Control', 'max-age=3600')
+        super().end_headers()
+
+    def do_GET(self):
+        # Serve the precompressed .gz sibling of a data file when the
+        # browser accepts gzip; it decompresses transparently
+        path = self.translate_path(self.path)
+        if (path.endswith(('.json', '.bin'))
+                and 'gzip' in self.headers.get('Accept-Encoding', '')
+                and os.path.exists(path + '.gz')):
+            with open(path + '.gz', 'rb') as f:
+                self.send_response(200)
+                self.send_header('Content-Type', self.guess_type(path))
+                self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+                self.end_headers()
+                shutil.copyfileobj(f, self.wfile)
+            return
+        super().do_GET()
+
 def open_browser():
     """Open browser after a short delay"""
     time.sleep(2)  # Wait for server to start
@@ -36,8 +65,9 @@ def main():
     browser_thread.daemon = True
     browser_thread.start()
     
-    # Start HTTP server
-    with socketserver.TCPServer(("", PORT), http.server.SimpleHTTPRequestHandler) as httpd:
+    # Start HTTP server; the threading server answers requests concurrently,
+    # so the browser can fetch the page, data and CDN assets in parallel
+    with ThreadingHTTPServer(("", PORT), MapRequestHandler) as httpd:
         print(f"Server started at http://localhost:{PORT}")
         print(f"{HTML_OUTPUT_FILE} should open automatically in your browser")
         print("Press Ctrl+C to stop the server")
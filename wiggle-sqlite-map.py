@@ -11,50 +11,74 @@ DB_FILE = 'db/italy_networks.sqlite'
 
 
 import pandas as pd    # Read data from Wigle Wifi Capture
-import folium          # Mapping Library
+import numpy as np     # Binary packing of numeric columns
 import sqlite3         # SQLite database connection
 import os
 import sys
 import re
 import json
+import gzip            # Precompressed payloads for the HTTP server
+import shutil
+import subprocess      # Optional tippecanoe invocation for vector tiles
+import multiprocessing  # Parallel JSON serialization
 import webbrowser     # For opening browser automatically
 import time           # For adding delay before opening browser
 
+try:
+    import orjson      # Much faster JSON encoder, optional
+except ImportError:
+    orjson = None
+
 # Configuration
 HTML_OUTPUT_FILE = 'mapdata.html'
 
+# Pre-tile the networks into z/x/y vector tiles with tippecanoe when it is
+# installed; client memory and load time then stay independent of dataset
+# size because only the tiles in view are fetched
+GENERATE_VECTOR_TILES = False
+TILES_DIR = 'tiles'
+
+# Control characters that must never reach the JavaScript side
+_CTRL_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Character-level JS escapes, applied in one C-level str.translate pass
+_JS_ESCAPE = str.maketrans({"'": "\\'", '"': '\\"', '\n': ' ', '\r': ' ', '\t': ' '})
+
+
+def _dumps(obj):
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 def clean_text_for_js(text):
     """Clean text to be safe for JavaScript strings"""
     if text is None:
         return ""
-    
-    # Convert to string and clean
-    text = str(text)
-    
-    # Remove or replace problematic characters
-    text = text.replace("'", "\\'")
-    text = text.replace('"', '\\"')
-    text = text.replace('\n', ' ')
-    text = text.replace('\r', ' ')
-    text = text.replace('\t', ' ')
-    
-    # Remove any other control characters
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-    
-    # Limit length to prevent issues
-    if len(text) > 100:
-        text = text[:97] + "..."
-    
-    return text.strip()
+
+    # Escape quotes and collapse whitespace in one translate pass, strip
+    # remaining control characters with the precompiled pattern, and limit
+    # length to prevent issues
+    return _CTRL_RE.sub('', str(text).translate(_JS_ESCAPE))[:100].strip()
 
 
 def load_data_from_sqlite(db_path):
     """Load WiFi network data from SQLite database"""
     try:
         conn = sqlite3.connect(db_path)
-        df = pd.read_sql_query("""
-            SELECT 
+        # Read-only access; mmap the database and keep temp structures in
+        # RAM so the fetch avoids needless page copies
+        conn.executescript("""
+            PRAGMA query_only = 1;
+            PRAGMA mmap_size = 268435456;
+            PRAGMA temp_store = MEMORY;
+        """)
+        # Filter invalid rows at the database layer so pandas never
+        # materializes NULL or '?' placeholder coordinates, and skip the
+        # unused altitude/accuracy columns to shrink the result set
+        cur = conn.execute("""
+            SELECT
                 bssid as MAC,
                 ssid as SSID,
                 capabilities as AuthMode,
@@ -63,13 +87,52 @@ def load_data_from_sqlite(db_path):
                 bestlevel as RSSI,
                 lastlat as CurrentLatitude,
                 lastlon as CurrentLongitude,
-                0 as AltitudeMeters,
-                0 as AccuracyMeters,
                 type as Type
             FROM network
             WHERE type = 'W'
-        """, conn)
+              AND lastlat IS NOT NULL
+              AND lastlon IS NOT NULL
+              AND typeof(lastlat) IN ('real', 'integer')
+              AND typeof(lastlon) IN ('real', 'integer')
+              AND lastlat BETWEEN -90 AND 90
+              AND lastlon BETWEEN -180 AND 180
+        """)
+        # Build the DataFrame straight from the cursor: read_sql_query
+        # buffers the result in per-column Python lists first, roughly
+        # quadrupling peak memory during the load
+        columns = [description[0] for description in cur.description]
+        df = pd.DataFrame.from_records(cur.fetchall(), columns=columns)
         conn.close()
+
+        # Coerce coordinates to numeric once; WiGLE exports can contain '?'
+        # placeholders which become NaN here and are dropped by dropna() later
+        df['CurrentLatitude'] = pd.to_numeric(df['CurrentLatitude'], errors='coerce')
+        df['CurrentLongitude'] = pd.to_numeric(df['CurrentLongitude'], errors='coerce')
+
+        # Downcast numerics: float32 still gives ~1 cm lat/lon precision and
+        # RSSI/channel fit in 16 bits (the nullable dtypes tolerate NULLs),
+        # halving the memory of every numeric column. Channel is really the
+        # frequency in MHz, so 60 GHz networks need the unsigned range; clip
+        # both columns first so one malformed outlier row cannot make the
+        # cast raise and abort the whole load
+        df['RSSI'] = pd.to_numeric(df['RSSI'], errors='coerce').clip(-32768, 32767)
+        df['Channel'] = pd.to_numeric(df['Channel'], errors='coerce').clip(0, 65535)
+        df = df.astype({
+            'CurrentLatitude': 'float32',
+            'CurrentLongitude': 'float32',
+            'RSSI': 'Int16',
+            'Channel': 'UInt16',
+        })
+
+        # Arrow-backed strings live in contiguous buffers, so the vectorized
+        # .str cleaning later runs in Arrow C++ instead of iterating Python
+        # objects; plain pandas strings are the fallback without pyarrow
+        text_columns = ('SSID', 'MAC', 'AuthMode', 'Type')
+        try:
+            df = df.astype({col: 'string[pyarrow]' for col in text_columns})
+        except ImportError:
+            df = df.astype({col: 'string' for col in text_columns})
+
         return df
     except Exception as e:
         print(f"Error loading data from SQLite: {e}")
@@ -78,64 +141,214 @@ def load_data_from_sqlite(db_path):
 
 def filter_valid_networks(df):
     """Filter and clean WiFi network data"""
-    valid = []
-    for rows in df[['MAC', 'SSID', 'AuthMode', 'FirstSeen', 'Channel', 'RSSI', 'CurrentLatitude', 'CurrentLongitude', 'AltitudeMeters', 'AccuracyMeters', 'Type']].values:
-        if (rows[10] == 'W'):
-            valid.append(rows)
-    
-    # Clean Set by dropping all NA values
-    validframes = pd.DataFrame(valid).dropna()
-    validframes.columns = ['MAC', 'SSID', 'AuthMode', 'FirstSeen', 'Channel', 'RSSI', 'CurrentLatitude', 'CurrentLongitude', 'AltitudeMeters', 'AccuracyMeters', 'Type']
-    
+    # Vectorized boolean indexing instead of a per-row Python loop
+    # (the SQL query already restricts to type = 'W', this is just a guard)
+    validframes = df.loc[df['Type'].eq('W')].dropna().reset_index(drop=True)
+
+    # Round coordinates to ~1 m precision and keep one row per BSSID;
+    # fuzzy exports can repeat the same network with jittered positions,
+    # and every duplicate costs payload bytes and a marker on the map
+    validframes['CurrentLatitude'] = validframes['CurrentLatitude'].round(5)
+    validframes['CurrentLongitude'] = validframes['CurrentLongitude'].round(5)
+    validframes = validframes.drop_duplicates(subset='MAC', keep='last').reset_index(drop=True)
+
     return validframes
 
 
-def save_data_to_json(validframes, json_file='wifi_data.json'):
-    """Save WiFi data to JSON file for asynchronous loading"""
+def _spatial_sort(records):
+    """Order records along a Morton (Z-order) curve
+
+    Quantizes lat/lon to 16 bits each and interleaves the bits, so
+    consecutive records are spatial neighbours. The cluster layer inserts
+    points in chunks, and spatially coherent chunks keep its internal
+    index balanced and make partially loaded data appear region by region.
+    """
+    lat = np.round((records['lat'].to_numpy(dtype='f8') + 90.0) / 180.0 * 65535.0).astype(np.uint32)
+    lon = np.round((records['lon'].to_numpy(dtype='f8') + 180.0) / 360.0 * 65535.0).astype(np.uint32)
+
+    def _spread_bits(v):
+        # Spread the low 16 bits of v so a zero bit follows each of them
+        v = (v | (v << 8)) & np.uint32(0x00FF00FF)
+        v = (v | (v << 4)) & np.uint32(0x0F0F0F0F)
+        v = (v | (v << 2)) & np.uint32(0x33333333)
+        v = (v | (v << 1)) & np.uint32(0x55555555)
+        return v
+
+    key = (_spread_bits(lon) << 1) | _spread_bits(lat)
+    return records.iloc[np.argsort(key, kind='stable')].reset_index(drop=True)
+
+
+def _prepare_records(validframes):
+    """Clean and rename columns into the lat/lon/ssid/... layout the map uses"""
+    # Coordinates are already numeric and NaN-free here (coerced on load,
+    # dropped in filter_valid_networks), so no per-row validity checks needed
+    records = validframes[['CurrentLatitude', 'CurrentLongitude', 'SSID', 'MAC', 'RSSI', 'Channel', 'AuthMode']].copy()
+    # Vectorized equivalent of clean_text_for_js, applied to whole columns
+    for col in ('SSID', 'MAC', 'AuthMode'):
+        records[col] = (records[col]
+                        .fillna('')
+                        .str.translate({10: 32, 13: 32, 9: 32})
+                        .str.replace(_CTRL_RE, '', regex=True)
+                        .str.replace("'", "\\'", regex=False)
+                        .str.replace('"', '\\"', regex=False)
+                        .str.slice(0, 100)
+                        .str.strip())
+    # RSSI/Channel are already 16-bit integers since the load step
+    records = records.rename(columns={
+        'CurrentLatitude': 'lat',
+        'CurrentLongitude': 'lon',
+        'SSID': 'ssid',
+        'MAC': 'mac',
+        'RSSI': 'rssi',
+        'Channel': 'channel',
+        'AuthMode': 'auth'
+    })
+    return _spatial_sort(records)
+
+
+def save_data_to_binary(validframes, bin_file='wifi_data.bin'):
+    """Save WiFi data as a compact struct-of-arrays binary payload
+
+    Layout (little-endian): uint32 count, float32 lat[N], float32 lon[N],
+    uint16 channel[N], int8 rssi[N], padding to 4-byte alignment,
+    uint32 offsets[3N+1], then a UTF-8 string table holding ssid/mac/auth
+    for each network. Roughly 5x smaller than the JSON with per-record keys
+    and decoded on the client as typed arrays instead of parsed objects.
+    """
+    print(f"Saving {len(validframes)} WiFi networks to {bin_file}...")
+
+    records = _prepare_records(validframes)
+    n = len(records)
+
+    lat = records['lat'].to_numpy(dtype='<f4')
+    lon = records['lon'].to_numpy(dtype='<f4')
+    channel = records['channel'].clip(0, 65535).to_numpy(dtype='<u2')
+    rssi = records['rssi'].clip(-128, 127).to_numpy(dtype='<i1')
+
+    # Interleave ssid/mac/auth per record into one flat string table
+    parts = np.empty(3 * n, dtype=object)
+    parts[0::3] = records['ssid'].to_numpy()
+    parts[1::3] = records['mac'].to_numpy()
+    parts[2::3] = records['auth'].to_numpy()
+    encoded = [str(p).encode('utf-8') for p in parts]
+    offsets = np.zeros(3 * n + 1, dtype='<u4')
+    np.cumsum(np.fromiter((len(b) for b in encoded), dtype='<u4', count=3 * n),
+              out=offsets[1:])
+
+    with open(bin_file, 'wb') as f:
+        f.write(np.uint32(n).tobytes())
+        f.write(lat.tobytes())
+        f.write(lon.tobytes())
+        f.write(channel.tobytes())
+        f.write(rssi.tobytes())
+        # Pad so the offsets array starts 4-byte aligned for the JS view
+        f.write(b'\x00' * (-(4 + 4 * n + 4 * n + 2 * n + n) % 4))
+        f.write(offsets.tobytes())
+        f.write(b''.join(encoded))
+    _write_gzip(bin_file)
+
+    print(f"Saved {n} WiFi networks to {bin_file}")
+    return n
+
+
+def _write_gzip(path):
+    """Write a precompressed .gz sibling for the HTTP server to send as-is"""
+    with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+
+
+def _serialize_chunk(chunk):
+    """Serialize one DataFrame chunk to JSON bytes without enclosing [ ]"""
+    # Strip the brackets so the chunks concatenate into one array
+    return _dumps(chunk.to_dict(orient='records'))[1:-1]
+
+
+def save_data_to_json(validframes, json_file='wifi_data.json', chunk_size=50000):
+    """Save WiFi data to JSON file for asynchronous loading
+
+    Serializes the records in chunks and streams them to the file, so peak
+    memory stays proportional to chunk_size instead of the whole record
+    list plus its JSON encoding. Multiple chunks are serialized in parallel
+    across CPU cores, with imap keeping the output order stable.
+    """
     print(f"Saving {len(validframes)} WiFi networks to {json_file}...")
-    
-    wifi_data = []
-    for _, row in validframes.iterrows():
-        if ("?" not in str(row['CurrentLatitude'])) and ("?" not in str(row['CurrentLongitude'])):
-            wifi_data.append({
-                'lat': float(row['CurrentLatitude']),
-                'lon': float(row['CurrentLongitude']),
-                'ssid': clean_text_for_js(row['SSID']),
-                'mac': clean_text_for_js(row['MAC']),
-                'rssi': int(row['RSSI']) if pd.notna(row['RSSI']) else 0,
-                'channel': int(row['Channel']) if pd.notna(row['Channel']) else 0,
-                'auth': clean_text_for_js(row['AuthMode']) if pd.notna(row['AuthMode']) else ''
-            })
-    
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(wifi_data, f, ensure_ascii=False, indent=2)
-    
-    print(f"Saved {len(wifi_data)} WiFi networks to {json_file}")
-    return len(wifi_data)
 
+    records = _prepare_records(validframes)
+    n = len(records)
+    chunks = [records.iloc[start:start + chunk_size] for start in range(0, n, chunk_size)]
 
-def create_lightweight_map(validframes, output_file=HTML_OUTPUT_FILE, json_file='wifi_data.json'):
-    """Create lightweight HTML map with asynchronous data loading and marker virtualization"""
-    # Compute Average of all the latitudes and longitudes in our dataset to find center and set zoom
-    center_lat = validframes.CurrentLatitude.mean()
-    center_lon = validframes.CurrentLongitude.mean()
-    
-    # Create basic map
-    mymap = folium.Map(location=[center_lat, center_lon], zoom_start=17)
-    
-    # Add a simple marker to show the map is working
-    folium.Marker(
-        location=[center_lat, center_lon],
-        tooltip="Map Center",
-        popup="WiFi Network Map<br>Loading data...",
-        icon=folium.Icon(color='blue', prefix='fa', icon='info')
-    ).add_to(mymap)
-    
-    # Save basic map
-    mymap.save(output_file)
-    
-    # Create enhanced HTML with custom JavaScript for async loading and marker virtualization
-    enhanced_html = f"""
+    # Compact bytes: the consumer is JavaScript, not a human, and the
+    # smaller file is also faster for the browser to fetch and parse
+    with open(json_file, 'wb') as f:
+        f.write(b'[')
+        if len(chunks) > 1 and multiprocessing.cpu_count() > 1:
+            with multiprocessing.Pool() as pool:
+                for i, part in enumerate(pool.imap(_serialize_chunk, chunks)):
+                    if i:
+                        f.write(b',')
+                    f.write(part)
+        else:
+            # Not worth spawning workers for a single chunk
+            for i, chunk in enumerate(chunks):
+                if i:
+                    f.write(b',')
+                f.write(_serialize_chunk(chunk))
+        f.write(b']')
+    _write_gzip(json_file)
+
+    print(f"Saved {n} WiFi networks to {json_file}")
+    return n
+
+
+def create_vector_tiles(validframes, tiles_dir=TILES_DIR, geojson_file='wifi_data.geojson'):
+    """Pre-tile the networks into z/x/y vector tiles with tippecanoe
+
+    Writes the records as newline-delimited GeoJSON and runs tippecanoe
+    over it. Returns True when the tile directory was generated; callers
+    fall back to the monolithic binary/JSON payloads otherwise.
+    """
+    if shutil.which('tippecanoe') is None:
+        print("tippecanoe not found on PATH, skipping vector tile generation")
+        return False
+
+    records = _prepare_records(validframes)
+    print(f"Tiling {len(records)} WiFi networks into {tiles_dir}/...")
+
+    # Newline-delimited features stream straight into tippecanoe without
+    # ever holding a full FeatureCollection in memory
+    with open(geojson_file, 'wb') as f:
+        for rec in records.to_dict(orient='records'):
+            f.write(_dumps({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [rec['lon'], rec['lat']]},
+                'properties': {key: rec[key] for key in ('ssid', 'mac', 'rssi', 'channel', 'auth')},
+            }))
+            f.write(b'\n')
+
+    if os.path.isdir(tiles_dir):
+        shutil.rmtree(tiles_dir)
+    # --no-tile-compression because the plain HTTP server sends the .pbf
+    # files as-is, without a Content-Encoding header
+    result = subprocess.run(
+        ['tippecanoe', '--output-to-directory', tiles_dir, '--layer', 'networks',
+         '-zg', '--drop-densest-as-needed', '--no-tile-compression', '--force',
+         geojson_file],
+        capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"tippecanoe failed: {result.stderr.strip()}")
+        return False
+
+    print(f"Vector tiles saved to {tiles_dir}/")
+    return True
+
+
+# Leaflet.VectorGrid is only loaded when the map uses pre-generated tiles
+_VECTORGRID_SCRIPT_TAG = '<script src="https://cdn.jsdelivr.net/npm/leaflet.vectorgrid@1.3.0/dist/Leaflet.VectorGrid.bundled.js"></script>'
+
+# HTML template for the lightweight map with custom JavaScript for async
+# loading and marker clustering; placeholders are filled via str.format_map,
+# so literal braces in the CSS/JS are doubled
+_LIGHT_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -143,7 +356,8 @@ def create_lightweight_map(validframes, output_file=HTML_OUTPUT_FILE, json_file=
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>WiFi Network Visualizer</title>
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css"/>
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.2.0/css/all.min.css"/>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/MarkerCluster.css"/>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/MarkerCluster.Default.css"/>
     <style>
         #map {{
             height: 100vh;
@@ -197,40 +411,40 @@ def create_lightweight_map(validframes, output_file=HTML_OUTPUT_FILE, json_file=
     </div>
     <div class="stats" id="stats">
         <div>Total: <span id="total-count">0</span></div>
-        <div>Visible: <span id="visible-count">0</span></div>
     </div>
 
     <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/leaflet.markercluster@1.5.3/dist/leaflet.markercluster.js"></script>
+    {extra_scripts}
     <script>
         // Global variables
         var map = null;
-        var allData = [];
-        var visibleMarkers = [];
-        var markerCache = new Map();
-        var isDataLoaded = false;
-        
+
+        // All visible points are painted onto one shared canvas instead of
+        // one DOM element per marker
+        const renderer = L.canvas({{padding: 0.5}});
+
         // Initialize map
         function initMap() {{
             map = L.map('map').setView([{center_lat}, {center_lon}], 17);
-            
+
             L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
                 attribution: '© OpenStreetMap contributors'
             }}).addTo(map);
-            
-            // Add event listeners for map movement
-            map.on('moveend', updateVisibleMarkers);
-            map.on('zoomend', updateVisibleMarkers);
         }}
-        
-        // Create marker with caching
+
+        // Create a single network marker; popup and tooltip content is
+        // built lazily on interaction, since almost no popup is ever opened
         function createMarker(network) {{
-            const key = `${{network.lat}},${{network.lon}},${{network.mac}}`;
-            
-            if (markerCache.has(key)) {{
-                return markerCache.get(key);
-            }}
-            
-            const popupContent = `
+            return L.circleMarker([network.lat, network.lon], {{
+                renderer: renderer,
+                radius: 4,
+                fillColor: 'red',
+                fillOpacity: 0.8,
+                stroke: false
+            }})
+            .bindTooltip(() => network.ssid, {{sticky: true}})
+            .bindPopup(() => `
                 <div style="font-family: Arial, sans-serif; font-size: 12px;">
                     <strong>SSID:</strong> ${{network.ssid}}<br>
                     <strong>BSSID:</strong> ${{network.mac}}<br>
@@ -238,101 +452,169 @@ def create_lightweight_map(validframes, output_file=HTML_OUTPUT_FILE, json_file=
                     <strong>Channel:</strong> ${{network.channel}}<br>
                     <strong>Auth:</strong> ${{network.auth}}
                 </div>
-            `;
-            
-            const marker = L.marker([network.lat, network.lon], {{
-                icon: L.divIcon({{
-                    className: 'custom-div-icon',
-                    html: '<i class="fa fa-wifi" style="color: red; font-size: 16px;"></i>',
-                    iconSize: [16, 16],
-                    iconAnchor: [8, 8]
-                }})
-            }})
-            .bindTooltip(network.ssid)
-            .bindPopup(popupContent);
-            
-            markerCache.set(key, marker);
-            return marker;
+            `, {{maxWidth: 300}});
         }}
-        
-        // Update visible markers based on current map bounds
-        function updateVisibleMarkers() {{
-            if (!isDataLoaded || !map) return;
-            
-            const bounds = map.getBounds();
-            const newVisibleMarkers = [];
-            
-            // Find markers within current bounds
-            for (const network of allData) {{
-                if (bounds.contains([network.lat, network.lon])) {{
-                    newVisibleMarkers.push(network);
-                }}
-            }}
-            
-            // Remove markers that are no longer visible
-            for (const marker of visibleMarkers) {{
-                if (marker && marker.remove) {{
-                    marker.remove();
-                }}
-            }}
-            
-            // Add new visible markers
-            visibleMarkers = [];
-            for (const network of newVisibleMarkers) {{
-                const marker = createMarker(network);
-                marker.addTo(map);
-                visibleMarkers.push(marker);
+
+        // Decode the struct-of-arrays binary payload written by Python:
+        // uint32 count, f32 lat[N], f32 lon[N], u16 channel[N], i8 rssi[N],
+        // padding to 4 bytes, u32 offsets[3N+1], UTF-8 string table
+        function decodeBinary(buf) {{
+            const n = new Uint32Array(buf, 0, 1)[0];
+            let pos = 4;
+            const lat = new Float32Array(buf, pos, n); pos += 4 * n;
+            const lon = new Float32Array(buf, pos, n); pos += 4 * n;
+            const channel = new Uint16Array(buf, pos, n); pos += 2 * n;
+            const rssi = new Int8Array(buf, pos, n); pos += n;
+            pos += (4 - (pos % 4)) % 4;
+            const offsets = new Uint32Array(buf, pos, 3 * n + 1); pos += 4 * (3 * n + 1);
+            const strtab = new Uint8Array(buf, pos);
+            const decoder = new TextDecoder();
+            const str = k => decoder.decode(strtab.subarray(offsets[k], offsets[k + 1]));
+            const data = new Array(n);
+            for (let i = 0; i < n; i++) {{
+                data[i] = {{
+                    lat: lat[i], lon: lon[i],
+                    rssi: rssi[i], channel: channel[i],
+                    ssid: str(3 * i), mac: str(3 * i + 1), auth: str(3 * i + 2)
+                }};
             }}
-            
-            // Update stats
-            document.getElementById('total-count').textContent = allData.length;
-            document.getElementById('visible-count').textContent = visibleMarkers.length;
+            return data;
         }}
-        
-        // Load data asynchronously
+
+        // Hand the decoded networks to the cluster layer,
+        // which only renders what is visible at the current zoom
+        function renderData(data) {{
+            const cluster = L.markerClusterGroup({{chunkedLoading: true, chunkInterval: 50}});
+            data.forEach(network => cluster.addLayer(createMarker(network)));
+            map.addLayer(cluster);
+
+            document.getElementById('total-count').textContent = data.length;
+            document.getElementById('progress-text').textContent = `${{data.length}} networks loaded`;
+            document.getElementById('progress-bar').style.width = '100%';
+
+            // Hide loading screen
+            setTimeout(() => {{
+                document.getElementById('loading').style.display = 'none';
+            }}, 1000);
+        }}
+
+        // Load data asynchronously, preferring the compact binary payload
         function loadData() {{
-            fetch('{json_file}')
-                .then(response => response.json())
-                .then(data => {{
-                    allData = data;
-                    isDataLoaded = true;
-                    
-                    document.getElementById('total-count').textContent = data.length;
-                    document.getElementById('progress-text').textContent = `${{data.length}} networks loaded`;
-                    document.getElementById('progress-bar').style.width = '100%';
-                    
-                    // Hide loading screen
-                    setTimeout(() => {{
-                        document.getElementById('loading').style.display = 'none';
-                    }}, 1000);
-                    
-                    // Show initial markers
-                    updateVisibleMarkers();
+            fetch('{bin_file}')
+                .then(response => {{
+                    if (!response.ok) throw new Error('binary payload unavailable');
+                    return response.arrayBuffer();
                 }})
+                .then(buf => renderData(decodeBinary(buf)))
+                .catch(() => fetch('{json_file}')
+                    .then(response => response.json())
+                    .then(renderData))
                 .catch(error => {{
                     console.error('Error loading data:', error);
                     document.getElementById('loading').innerHTML = '<h3>Error loading data</h3><p>Please check the console for details.</p>';
                 }});
         }}
         
+        // Render pre-generated vector tiles; only the tiles in view are
+        // fetched, so client memory is independent of dataset size
+        function loadTiles(tilesDir) {{
+            L.vectorGrid.protobuf(tilesDir + '/{{z}}/{{x}}/{{y}}.pbf', {{
+                rendererFactory: L.canvas.tile,
+                interactive: true,
+                vectorTileLayerStyles: {{
+                    networks: {{radius: 4, fill: true, fillColor: 'red', fillOpacity: 0.8, stroke: false}}
+                }}
+            }})
+            .on('click', e => {{
+                const p = e.layer.properties;
+                L.popup({{maxWidth: 300}})
+                    .setLatLng(e.latlng)
+                    .setContent(`
+                        <div style="font-family: Arial, sans-serif; font-size: 12px;">
+                            <strong>SSID:</strong> ${{p.ssid}}<br>
+                            <strong>BSSID:</strong> ${{p.mac}}<br>
+                            <strong>RSSI:</strong> ${{p.rssi}} dBm<br>
+                            <strong>Channel:</strong> ${{p.channel}}<br>
+                            <strong>Auth:</strong> ${{p.auth}}
+                        </div>
+                    `)
+                    .openOn(map);
+            }})
+            .addTo(map);
+
+            document.getElementById('loading').style.display = 'none';
+        }}
+
         // Initialize everything
         initMap();
-        loadData();
+        {load_call}
     </script>
 </body>
 </html>
 """
-    
+
+
+def _write_map_html(center_lat, center_lon, output_file, json_file, bin_file, tiles_dir=None):
+    """Render the lightweight map HTML for the given center and data files"""
+    enhanced_html = _LIGHT_HTML_TEMPLATE.format_map({
+        'center_lat': center_lat,
+        'center_lon': center_lon,
+        'json_file': json_file,
+        'bin_file': bin_file,
+        'extra_scripts': _VECTORGRID_SCRIPT_TAG if tiles_dir else '',
+        'load_call': f"loadTiles('{tiles_dir}');" if tiles_dir else 'loadData();',
+    })
+
     # Save enhanced HTML
     with open(output_file, 'w', encoding='utf-8') as f:
         f.write(enhanced_html)
     
-    print(f"Lightweight map with marker virtualization saved to {output_file}")
+    print(f"Lightweight map with marker clustering saved to {output_file}")
     return output_file
 
 
+def create_lightweight_map(validframes, output_file=HTML_OUTPUT_FILE, json_file='wifi_data.json', bin_file='wifi_data.bin', tiles_dir=None):
+    """Create lightweight HTML map with asynchronous data loading and marker clustering"""
+    # Compute Average of all the latitudes and longitudes in our dataset to find center and set zoom
+    center_lat = validframes.CurrentLatitude.mean()
+    center_lon = validframes.CurrentLongitude.mean()
+
+    return _write_map_html(center_lat, center_lon, output_file, json_file, bin_file, tiles_dir)
+
+
+def _cache_key(db_path):
+    """Identify the database contents by modification time and size"""
+    stat = os.stat(db_path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _read_cache_meta(json_file):
+    """Read the cache stamp written next to the JSON, or None if unusable"""
+    try:
+        with open(json_file + '.meta', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_meta(json_file, key, center_lat, center_lon, count, tiles=False):
+    """Stamp the generated data files with the database cache key"""
+    with open(json_file + '.meta', 'w', encoding='utf-8') as f:
+        json.dump({
+            'key': key,
+            'center_lat': center_lat,
+            'center_lon': center_lon,
+            'count': count,
+            'tiles': tiles,
+        }, f)
+
+
 def create_map(validframes, output_file=HTML_OUTPUT_FILE):
     """Create interactive map with WiFi network markers (legacy method)"""
+    # folium is only needed for this legacy path, so import it lazily and
+    # keep it off the lightweight map's critical path
+    import folium
+
     # Compute Average of all the latitudes and longitudes in our dataset to find center and set zoom
     center_lat = validframes.CurrentLatitude.mean()
     center_lon = validframes.CurrentLongitude.mean()
@@ -340,26 +622,26 @@ def create_map(validframes, output_file=HTML_OUTPUT_FILE):
     mymap = folium.Map(location=[center_lat, center_lon], zoom_start=17)
     
     # Add WiFi network markers
+    # Coordinates are already numeric and NaN-free at this point
     for coord in validframes[['CurrentLatitude','CurrentLongitude', 'SSID', 'Type', 'MAC']].values:
-        if ("?" not in str(coord[0])) and ("?" not in str(coord[1])):
-            # Clean the text data
-            ssid = clean_text_for_js(coord[2])
-            mac = clean_text_for_js(coord[4])
-            
-            # Create safe popup content
-            popup_content = f"""
-            <div style="font-family: Arial, sans-serif; font-size: 12px;">
-                <strong>SSID:</strong> {ssid}<br>
-                <strong>BSSID:</strong> {mac}
-            </div>
-            """
-            
-            folium.Marker(
-                location=[coord[0], coord[1]],
-                tooltip=ssid,
-                popup=folium.Popup(popup_content, max_width=300),
-                icon=folium.Icon(color='red', prefix='fa', icon='wifi')
-            ).add_to(mymap)
+        # Clean the text data
+        ssid = clean_text_for_js(coord[2])
+        mac = clean_text_for_js(coord[4])
+
+        # Create safe popup content
+        popup_content = f"""
+        <div style="font-family: Arial, sans-serif; font-size: 12px;">
+            <strong>SSID:</strong> {ssid}<br>
+            <strong>BSSID:</strong> {mac}
+        </div>
+        """
+
+        folium.Marker(
+            location=[coord[0], coord[1]],
+            tooltip=ssid,
+            popup=folium.Popup(popup_content, max_width=300),
+            icon=folium.Icon(color='red', prefix='fa', icon='wifi')
+        ).add_to(mymap)
     
     # Save map to HTML file
     mymap.save(output_file)
@@ -381,8 +663,25 @@ def main():
         sys.exit(1)
     
     print("Database file found!")
+
+    json_file = 'wifi_data.json'
+    bin_file = 'wifi_data.bin'
+
+    # Skip the whole SQLite/pandas/serialization pipeline when the database
+    # has not changed since the data files were generated
+    cache_key = _cache_key(db_path)
+    meta = _read_cache_meta(json_file)
+    if (meta and meta.get('key') == cache_key
+            and os.path.exists(json_file) and os.path.exists(bin_file)):
+        print("Database unchanged since last run, reusing existing data files")
+        cached_tiles = TILES_DIR if meta.get('tiles') and os.path.isdir(TILES_DIR) else None
+        _write_map_html(meta['center_lat'], meta['center_lon'], HTML_OUTPUT_FILE, json_file, bin_file, cached_tiles)
+        print(f"\nWiFi Network Visualization completed!")
+        print(f"Reused {meta.get('count', 0)} WiFi network markers")
+        return
+
     print("Loading WiFi network data from SQLite database...")
-    
+
     # Load data from SQLite
     df = load_data_from_sqlite(db_path)
     if df is None:
@@ -400,18 +699,29 @@ def main():
     print("Sample filtered data:")
     print(validframes.head())
     
-    # Save data to JSON for lightweight map
-    print("\nCreating lightweight map with JSON data...")
-    json_file = 'wifi_data.json'
+    # Save data for the lightweight map: compact binary payload for the
+    # browser plus JSON as a human-inspectable fallback
+    print("\nCreating lightweight map...")
     num_networks = save_data_to_json(validframes, json_file)
-    
-    # Create lightweight map
-    create_lightweight_map(validframes, HTML_OUTPUT_FILE, json_file)
+    save_data_to_binary(validframes, bin_file)
+
+    # Optionally pre-tile the networks so the browser only ever fetches
+    # the tiles in view instead of the whole payload
+    use_tiles = GENERATE_VECTOR_TILES and create_vector_tiles(validframes)
+
+    # Create lightweight map and stamp the data files for the next run
+    create_lightweight_map(validframes, HTML_OUTPUT_FILE, json_file, bin_file,
+                           TILES_DIR if use_tiles else None)
+    _write_cache_meta(json_file, cache_key,
+                      float(validframes.CurrentLatitude.mean()),
+                      float(validframes.CurrentLongitude.mean()),
+                      num_networks, tiles=use_tiles)
     
     print(f"\nWiFi Network Visualization completed!")
     print(f"Created {num_networks} WiFi network markers")
     print("Files created:")
-    print(f"  - {json_file} (WiFi data)")
+    print(f"  - {bin_file} (WiFi data, binary)")
+    print(f"  - {json_file} (WiFi data, JSON fallback)")
     print(f"  - {HTML_OUTPUT_FILE} (Lightweight map)")
 
 if __name__ == "__main__":